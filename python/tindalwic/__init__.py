@@ -1,14 +1,13 @@
-import os
+import re
+import threading
 from abc import ABC
 from collections import UserString
 from collections.abc import Mapping, Sequence
 from io import BytesIO, StringIO
-from typing import Any, BinaryIO, ClassVar, Generator, TypeAlias
+from typing import Any, ClassVar, Generator, Iterator, Self, TypeAlias
 
 from .pointer import Indent
 
-_devnull: BinaryIO = open(os.devnull, "wb")
-
 # multiple inheritance (from builtins in particular) means that __slots__ and __init__
 # must be written as below to avoid TypeError about instance lay-out conflict.
 
@@ -27,6 +26,26 @@ __all__ = [
 
 Encoded: TypeAlias = bytes | bytearray | memoryview
 
+# one pass over the input (lazily, via finditer) finds each line, its leading tabs,
+# and the first `=` after them. the empty match at the very end is not a line.
+_LINES = re.compile(rb"((\t*)(?:[^\n=]*(=))?[^\n]*)\n?")
+
+# lookup table: which first bytes (after indentation) are syntax rather than data.
+# checked before the other cases so plain items and `key=value` entries match first.
+_MARKERS = bytes(byte in b"\n#/<[{" for byte in range(256))
+
+
+def _handler(table: dict[type, str], any: object) -> str | None:
+    """method name for the type of `any`: exact type is the fast path, the MRO is
+    searched for subclasses. names (not functions) so that subclass overrides win."""
+    handler = table.get(type(any))
+    if handler is None:
+        for cls in type(any).__mro__:
+            handler = table.get(cls)
+            if handler is not None:
+                break
+    return handler
+
 
 class UTF8:
     encoded: Encoded
@@ -48,27 +67,32 @@ class UTF8:
         self.encoded = encoded
         self.dedent = dedent
 
+    @classmethod
+    def _parsed(cls, encoded: Encoded, dedent: int) -> Self:
+        """the parser only produces valid arguments: skip the checks in __init__."""
+        utf8 = cls.__new__(cls)
+        utf8.encoded = encoded
+        utf8.dedent = dedent
+        return utf8
+
     def lines(self) -> Generator[Encoded]:
-        limit = len(self.encoded)
-        if self.dedent < 0 or limit == 0:
+        if self.dedent < 0 or not self.encoded:
             yield self.encoded
             return
-        start = index = 0
-        while index < limit:
-            if self.encoded[index] != 10:
-                index += 1
+        # split (memchr in C) rather than walking the bytes in a python loop
+        lines = bytes(self.encoded).split(b"\n")
+        last = len(lines) - 1
+        yield lines[0]
+        tabs = b"\t" * self.dedent
+        for index in range(1, len(lines)):
+            line = lines[index]
+            if line.startswith(tabs):
+                yield line[self.dedent :]
+            elif index < last or line:
+                missing = self.dedent - len(line) + len(line.lstrip(b"\t"))
+                raise ValueError(f"dedent=={self.dedent} tabs=={missing}")
             else:
-                yield self.encoded[start:index]
-                index += 1
-                if index < limit:
-                    tabs = self.dedent
-                    while tabs > 0:
-                        if index >= limit or self.encoded[index] != 9:
-                            raise ValueError(f"dedent=={self.dedent} tabs=={tabs}")
-                        index += 1
-                        tabs -= 1
-                start = index
-        yield self.encoded[start:index]
+                yield line
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, UTF8):
@@ -78,6 +102,8 @@ class UTF8:
         return list(self.lines()) == list(other.lines())
 
     def __bytes__(self) -> bytes:
+        if self.dedent <= 0:  # nothing to strip, skip the generator and join
+            return bytes(self.encoded)
         return b"\n".join(self.lines())
 
     def __str__(self) -> str:
@@ -120,6 +146,12 @@ class Text(UTF8, Value):
         super().__init__(encoded, dedent)
         self.comment_after = after
 
+    @classmethod
+    def _parsed(cls, encoded: Encoded, dedent: int) -> Self:
+        text = super()._parsed(encoded, dedent)
+        text.comment_after = None
+        return text
+
     def _repr_args(self, args: list[str]) -> None:
         super()._repr_args(args)  # lines
         if self.comment_after is not None:
@@ -157,13 +189,28 @@ class List(list[Value], Value):
 class Key(str):
     blank_line_before: bool  # = False
     comment_before: Comment | None  # = None
-    __slots__ = ("blank_line_before", "comment_before")
+    __slots__ = ("blank_line_before", "comment_before", "_encoded")
 
     def __init__(self, handled_by_str_new_but_here_for_type_hint: Any):
         if "\n" in self:
             raise ValueError("newline in key")
         self.blank_line_before = False
         self.comment_before = None
+        self._encoded: bytes | None = None
+
+    @classmethod
+    def _parsed(cls, encoded: bytes) -> Self:
+        """the parser already holds the UTF-8 of the key, keep it for encoding."""
+        key = cls(encoded.decode())
+        key._encoded = encoded
+        return key
+
+    def _utf8(self) -> bytes:
+        # encoded on first use (str is immutable, so it never goes stale)
+        encoded = self._encoded
+        if encoded is None:
+            encoded = self._encoded = self.encode()
+        return encoded
 
 
 class Dict(dict[Key, Value], Value):
@@ -239,15 +286,20 @@ class File(dict[Key, Value]):
 
 # ========================================================================= ThreadLocal
 
+_thread = threading.local()
+
 
 class RAM:
     empty: ClassVar[memoryview] = memoryview(b"")
+    done: ClassVar[Iterator] = iter(())
     __slots__ = (
         "_errors",
         "_indent",
         "_count",
         "_write",
         "_parse",
+        "_bytes",
+        "_scan",
         "_next",
         "_line",
         "_tabs",
@@ -256,34 +308,50 @@ class RAM:
 
     def __init__(self):
         super().__init__()
-        self._errors = list[str]()
+        self._errors = StringIO()
         self._indent: Indent = Indent(b"")
         self._count: int = 0
-        self._write: BinaryIO = _devnull
+        self._write = bytearray()
         self._parse = RAM.empty
+        self._bytes = b""
+        self._scan: Iterator[re.Match] = RAM.done
         self._next: int = -1
         self._line = RAM.empty
         self._tabs: int = -1
         self._assign: int = -1
 
+    @classmethod
+    def local(cls) -> Self:
+        """one instance per class per thread, so repeated calls skip constructing."""
+        rams = getattr(_thread, "rams", None)
+        if rams is None:
+            rams = _thread.rams = dict[type, RAM]()
+        ram = rams.get(cls)
+        if ram is None:
+            ram = rams[cls] = cls()
+        return ram
+
     # -------------------------------------------------------------------------- errors
 
     def _error(self, message: str) -> str:
-        match self._errors:
-            case []:
-                return message
-            case _:
-                return f"{message}:\n\t{'\n\t'.join(self._errors)}"
+        if self._errors.tell():
+            return f"{message}:{self._errors.getvalue()}"
+        return message
 
     def _errors_add(self, *parts: Any) -> None:
-        message = StringIO()
+        # every message goes straight into the one buffer, each on its own line
+        errors = self._errors
+        errors.write("\n\t")
         if self._count:
-            message.write(f"#{self._count}: ")
+            errors.write(f"#{self._count}: ")
         for part in parts:
-            message.write(f"{part} ")
-        message.write("@")
-        self._indent.path(message)
-        self._errors.append(message.getvalue())
+            errors.write(f"{part} ")
+        errors.write("@")
+        self._indent.path(errors)
+
+    def _errors_clear(self) -> None:
+        self._errors.seek(0)
+        self._errors.truncate()
 
     # ----------------------------------------------------------------------- to python
 
@@ -293,11 +361,11 @@ class RAM:
         Returns a deep copy with any `Text` replaced by `str` instances,
         and the arrays replaced by their builtin analogs.
         """
-        self._errors.clear()
+        self._errors_clear()
         self._indent = self._indent.zero()
         try:
             match self._python(file):
-                case _ if self._errors:
+                case _ if self._errors.tell():
                     raise ValueError(self._error("illegal non-`Value` data"))
                 case None:
                     raise AssertionError("impossible: got None, but no error")
@@ -306,35 +374,64 @@ class RAM:
                 case other:
                     raise AssertionError(f"impossible: got {type(other)}")
         finally:
-            self._errors.clear()
+            self._errors_clear()
             self._indent = self._indent.zero()
 
     def _python(self, any: Value | File) -> str | list | dict | None:
-        match any:
-            case Text():
-                return str(any)
-            case List():
-                result = list()
-                self._indent = self._indent.more()
-                for key, value in enumerate(any):
-                    self._indent.key = key
-                    result.append(self._python(value))
-                self._indent = self._indent.less()
-                return result
-            case Dict() | File():
-                result = dict()
-                self._indent = self._indent.more()
-                for key, value in any.items():
-                    self._indent.key = key
-                    match key:
-                        case Key():
-                            result[str(key)] = self._python(value)
-                        case other:
-                            self._errors_add("key is", type(other))
-                self._indent = self._indent.less()
-                return result
-        self._errors_add("value is", type(any))
-        return None
+        # iterative: nesting costs a stack entry rather than python frames
+        root, items = self._pythonNode(any)
+        stack = list[tuple[Iterator, list | dict]]()
+        if items is not None:
+            self._indent = self._indent.more()
+            stack.append((items, root))
+        while stack:
+            items, into = stack[-1]
+            indent = self._indent
+            for key, value in items:
+                indent.key = key
+                if type(into) is dict and not isinstance(key, Key):
+                    self._errors_add("key is", type(key))
+                    continue
+                if type(value) is Text:
+                    result, items = self._pythonText(value)  # most common, no lookup
+                else:
+                    result, items = self._pythonNode(value)
+                if type(into) is list:
+                    into.append(result)
+                else:
+                    into[str(key)] = result
+                if items is not None:
+                    self._indent = indent.more()
+                    stack.append((items, result))
+                    break
+            else:
+                stack.pop()
+                self._indent = indent.less()
+        return root
+
+    def _pythonNode(self, any: Value | File) -> tuple[Any, Iterator | None]:
+        """converted value, and the items to fill it with (if it is a container)."""
+        convert = _handler(self._to_python, any)
+        if convert is None:
+            self._errors_add("value is", type(any))
+            return None, None
+        return getattr(self, convert)(any)
+
+    def _pythonText(self, text: Text) -> tuple[str, None]:
+        return str(text), None
+
+    def _pythonList(self, array: List) -> tuple[list, Iterator]:
+        return list(), enumerate(array)
+
+    def _pythonDict(self, array: Dict | File) -> tuple[dict, Iterator]:
+        return dict(), iter(array.items())
+
+    _to_python: ClassVar[dict[type, str]] = {
+        Text: "_pythonText",
+        List: "_pythonList",
+        Dict: "_pythonDict",
+        File: "_pythonDict",
+    }
 
     # --------------------------------------------------------------------- from python
 
@@ -343,11 +440,11 @@ class RAM:
 
         Returns deep copy except bytes/bytearray/memoryview are shared
         (even though some of those are mutable)."""
-        self._errors.clear()
+        self._errors_clear()
         self._indent = self._indent.zero()
         try:
             match self._value(mapping):
-                case _ if self._errors:
+                case _ if self._errors.tell():
                     raise ValueError(self._error("can't be converted to `Value`"))
                 case None:
                     raise AssertionError("impossible: got None, but no error")
@@ -356,85 +453,124 @@ class RAM:
                 case other:
                     raise AssertionError(f"impossible: got {type(other)}")
         finally:
-            self._errors.clear()
+            self._errors_clear()
             self._indent = self._indent.zero()
 
     def _value(self, any: Any) -> Value | None:
-        match any:
-            case None:
-                return Text(b"", -1)
-            case str() | UserString():
-                return Text(any.encode(), 0)
-            case bytes() | bytearray() | memoryview():
-                return Text(any, 0)
-            case Sequence():
-                result = List()
-                self._indent = self._indent.more()
-                for i, v in enumerate(any):
-                    self._indent.key = i
-                    x = self._value(v)
-                    if x is not None:
-                        result.append(x)
-                self._indent = self._indent.less()
-                return result
-            case Mapping():
-                result = Dict()
-                self._indent = self._indent.more()
-                for k, v in any.items():
-                    self._indent.key = k
-                    if isinstance(k, (str, UserString)):
-                        x = self._value(v)
-                        if x is not None:
-                            result[Key(k)] = x
-                    else:
-                        self._errors_add("key is", type(k))
-                self._indent = self._indent.less()
-                return result
-        self._errors_add("value is", type(any))
-        return None
+        # iterative, like _python: nesting costs a stack entry rather than frames
+        root, items = self._valueNode(any)
+        stack = list[tuple[Iterator, List | Dict]]()
+        if items is not None:
+            self._indent = self._indent.more()
+            stack.append((items, root))
+        while stack:
+            items, into = stack[-1]
+            indent = self._indent
+            for key, value in items:
+                indent.key = key
+                if type(into) is Dict and not isinstance(key, (str, UserString)):
+                    self._errors_add("key is", type(key))
+                    continue
+                if type(value) is str:
+                    result, items = self._valueStr(value)  # most common, no lookup
+                else:
+                    result, items = self._valueNode(value)
+                    if result is None:
+                        continue
+                if type(into) is List:
+                    into.append(result)
+                else:
+                    into[Key(key)] = result
+                if items is not None:
+                    self._indent = indent.more()
+                    stack.append((items, result))
+                    break
+            else:
+                stack.pop()
+                self._indent = indent.less()
+        return root
+
+    def _valueNode(self, any: Any) -> tuple[Any, Iterator | None]:
+        """converted value, and the items to fill it with (if it is a container)."""
+        convert = _handler(self._from_python, any)
+        if convert is None:
+            # virtual subclasses (`register`ed with the ABC) are not in the MRO
+            if isinstance(any, Sequence):
+                convert = "_valueList"
+            elif isinstance(any, Mapping):
+                convert = "_valueDict"
+            else:
+                self._errors_add("value is", type(any))
+                return None, None
+        return getattr(self, convert)(any)
+
+    def _valueNone(self, _: None) -> tuple[Text, None]:
+        return Text(b"", -1), None
+
+    def _valueStr(self, any: str | UserString) -> tuple[Text, None]:
+        return Text(any.encode(), 0), None
+
+    def _valueBytes(self, any: Encoded) -> tuple[Text, None]:
+        return Text(any, 0), None
+
+    def _valueList(self, any: Sequence) -> tuple[List, Iterator]:
+        return List(), enumerate(any)
+
+    def _valueDict(self, any: Mapping) -> tuple[Dict, Iterator]:
+        return Dict(), iter(any.items())
+
+    _from_python: ClassVar[dict[type, str]] = {
+        type(None): "_valueNone",
+        str: "_valueStr",
+        UserString: "_valueStr",
+        bytes: "_valueBytes",
+        bytearray: "_valueBytes",
+        memoryview: "_valueBytes",
+        list: "_valueList",
+        tuple: "_valueList",
+        Sequence: "_valueList",
+        dict: "_valueDict",
+        Mapping: "_valueDict",
+    }
 
     # -------------------------------------------------------------------------- encode
 
     def encode(self, file: File, into: BytesIO | None = None) -> BytesIO:
         """uses and returns either `into` or (if None) a freshly allocated BytesIO"""
-        self._errors.clear()
+        self._errors_clear()
         self._indent = self._indent.zero()
         try:
             self._count = 0
-            self._write = into or BytesIO()
             self._writeComment(b"#!", file.hashbang)
             self._writeDict(file)
-            if self._errors:
+            if self._errors.tell():
                 raise ValueError(self._error("illegal non-`Value` data"))
-            return self._write
+            into = into or BytesIO()
+            into.write(self._write)  # one copy, nothing partial reaches `into`
+            return into
         finally:
-            self._errors.clear()
+            self._errors_clear()
             self._indent = self._indent.zero()
-            self._write = _devnull
+            self._write.clear()  # frees the buffer, each encode grows it from empty
 
     def _writeIndent(self) -> None:
         if self._count:
-            self._write.write(b"\n")
+            self._write += self._indent._newline
             self._count += 1
         else:
             self._count = 1
-        self._write.write(self._indent._bytes)
+            self._write += self._indent._bytes
 
     def _writeUTF8(self, utf8: UTF8) -> None:
         if len(self._indent) == utf8.dedent:
-            self._write.write(utf8.encoded)
+            self._write += utf8.encoded
         elif utf8.encoded:
-            lines = utf8.lines()
-            self._write.write(next(lines))
-            for line in lines:
-                self._write.write(b"\n")
-                self._write.write(self._indent._bytes)
-                self._write.write(line)
+            self._write += self._indent._newline.join(utf8.lines())
 
     def _writeComment(self, marker: bytes, comment: Comment | None) -> None:
         if comment is not None:
             self._writeIndent()
-            self._write.write(marker)
+            self._write += marker
             self._indent = self._indent.more()
             self._writeUTF8(comment)
             self._indent = self._indent.less()
@@ -451,32 +587,15 @@ class RAM:
 
     def _writeList(self, array: List) -> None:
         self._writeComment(b"#", array.comment_intro)
+        indent = self._indent
         for index, value in enumerate(array):
-            self._indent.key = index
+            indent.key = index
             self._writeIndent()
-            match value:
-                case Text():
-                    if not self._shortList(value):
-                        self._write.write(b"<>")
-                        self._indent = self._indent.more()
-                        self._writeIndent()
-                        self._writeUTF8(value)
-                        self._indent = self._indent.less()
-                    elif value.encoded:
-                        self._write.write(value.encoded)
-                case List():
-                    self._write.write(b"[]")
-                    self._indent = self._indent.more()
-                    self._writeList(value)
-                    self._indent = self._indent.less()
-                case Dict():
-                    self._write.write(b"{}")
-                    self._indent = self._indent.more()
-                    self._writeDict(value)
-                    self._indent = self._indent.less()
-                case _:
-                    self._errors_add("value is", type(value))
-                    continue
+            write = _handler(self._write_value, value)
+            if write is None:
+                self._errors_add("value is", type(value))
+                continue
+            getattr(self, write)(None, value)
             self._writeComment(b"#", value.comment_after)
 
     def _shortDict(self, key: Key, text: Text) -> bool:
@@ -495,8 +614,9 @@ class RAM:
 
     def _writeDict(self, array: Dict | File) -> None:
         self._writeComment(b"#", array.comment_intro)
+        indent = self._indent
         for key, value in array.items():
-            self._indent.key = key
+            indent.key = key
             if not isinstance(key, Key):
                 self._count += 1  # because _writeIdent never called
                 self._errors_add("key is", type(key))
@@ -505,47 +625,74 @@ class RAM:
                 self._writeIndent()
             self._writeComment(b"//", key.comment_before)
             self._writeIndent()
-            match value:
-                case Text():
-                    if not self._shortDict(key, value):
-                        self._write.write(b"<")
-                        self._write.write(key.encode())
-                        self._write.write(b">")
-                        self._indent = self._indent.more()
-                        self._writeIndent()
-                        self._writeUTF8(value)
-                        self._indent = self._indent.less()
-                    else:
-                        self._write.write(key.encode())
-                        self._write.write(b"=")
-                        self._write.write(value.encoded)
-                case List():
-                    self._write.write(b"[")
-                    self._write.write(key.encode())
-                    self._write.write(b"]")
-                    self._indent = self._indent.more()
-                    self._writeList(value)
-                    self._indent = self._indent.less()
-                case Dict():
-                    self._write.write(b"{")
-                    self._write.write(key.encode())
-                    self._write.write(b"}")
-                    self._indent = self._indent.more()
-                    self._writeDict(value)
-                    self._indent = self._indent.less()
-                case _:
-                    self._errors_add("value is", type(value))
-                    continue
+            write = _handler(self._write_value, value)
+            if write is None:
+                self._errors_add("value is", type(value))
+                continue
+            getattr(self, write)(key, value)
             self._writeComment(b"#", value.comment_after)
 
+    def _writeText(self, key: Key | None, text: Text) -> None:
+        if key is None:
+            if self._shortList(text):
+                if text.encoded:
+                    self._write += text.encoded
+                return
+            self._write += b"<>"
+        elif self._shortDict(key, text):
+            self._write += key._utf8()
+            self._write += b"="
+            self._write += text.encoded
+            return
+        else:
+            self._write += b"<"
+            self._write += key._utf8()
+            self._write += b">"
+        self._indent = self._indent.more()
+        self._writeIndent()
+        self._writeUTF8(text)
+        self._indent = self._indent.less()
+
+    def _writeListValue(self, key: Key | None, array: List) -> None:
+        if key is None:
+            self._write += b"[]"
+        else:
+            self._write += b"["
+            self._write += key._utf8()
+            self._write += b"]"
+        self._indent = self._indent.more()
+        self._writeList(array)
+        self._indent = self._indent.less()
+
+    def _writeDictValue(self, key: Key | None, array: Dict) -> None:
+        if key is None:
+            self._write += b"{}"
+        else:
+            self._write += b"{"
+            self._write += key._utf8()
+            self._write += b"}"
+        self._indent = self._indent.more()
+        self._writeDict(array)
+        self._indent = self._indent.less()
+
+    # the `key` is None for List items
+    _write_value: ClassVar[dict[type, str]] = {
+        Text: "_writeText",
+        List: "_writeListValue",
+        Dict: "_writeDictValue",
+    }
+
     # -------------------------------------------------------------------------- decode
 
     def decode(self, buffer: Encoded) -> File:
-        self._errors.clear()
+        self._errors_clear()
         self._indent = self._indent.zero()
         try:
             self._count = 0
             self._parse = memoryview(buffer)
+            # keys are decoded from `bytes` slices, skipping a memoryview per key
+            self._bytes = buffer if type(buffer) is bytes else self._parse.tobytes()
+            self._scan = _LINES.finditer(self._parse)
             self._next = 0
             self._indent.key = ""
             self._readln()
@@ -553,42 +700,31 @@ class RAM:
             if len(self._line) > 1 and self._line[0] == 35 and self._line[1] == 33:
                 file.hashbang = self._readComment(2)
             self._readDict(file)
-            if self._errors:
+            if self._errors.tell():
                 raise ValueError(self._error("parse errors"))
             return file
         finally:
-            self._errors.clear()
+            self._errors_clear()
             self._indent = self._indent.zero()
             self._parse = self._line = RAM.empty
+            self._bytes = b""
+            self._scan = RAM.done
 
     def _readln(self) -> bool:
-        index = self._next
-        limit = len(self._parse)
-        if index >= limit:
+        line = next(self._scan, None)
+        if line is None or line.start() >= len(self._parse):
             if self._line is not RAM.empty:
                 self._count += 1
                 self._line = RAM.empty
                 self._tabs = self._assign = -1
             return False
-        byte = self._parse[index]
-        while byte == 9:
-            index += 1
-            if index >= limit:
-                byte = 10
-                break
-            byte = self._parse[index]
-        self._tabs = index - self._next
-        self._assign = -1
-        while byte != 10:
-            if byte == 61 and self._assign < 0:
-                self._assign = index - self._next
-            index += 1
-            if index >= limit:
-                break
-            byte = self._parse[index]
-        self._line = self._parse[self._next : index]
+        start, end = line.span(1)
+        self._tabs = line.end(2) - start
+        assign = line.start(3)
+        self._assign = assign - start if assign >= 0 else -1
+        self._line = self._parse[start:end]
         self._count += 1
-        self._next = index + 1
+        self._next = end + 1
         return True
 
     def _readExcess(self) -> None:
@@ -611,10 +747,10 @@ class RAM:
         while self._readln() and self._tabs >= indent:
             newline = True
         if self._tabs < 0:
-            end = self._next
+            end = self._next - 1  # EOF: the final LF ends the last line, not content
         else:
             end = self._next - len(self._line) - 2
-        return Comment(self._parse[start:end], indent if newline else -1)
+        return Comment._parsed(self._parse[start:end], indent if newline else -1)
 
     def _readText(self) -> Text:
         indent = len(self._indent) + 1
@@ -623,28 +759,33 @@ class RAM:
         while self._readln() and self._tabs >= indent:
             newline += 1
         if self._tabs < 0:
-            end = self._next
+            end = self._next - 1  # EOF: the final LF ends the last line, not content
         else:
             end = self._next - len(self._line) - 2
-        return Text(self._parse[start:end], indent if newline > 0 else -1)
+        return Text._parsed(self._parse[start:end], indent if newline > 0 else -1)
 
     def _readList(self, array: List) -> None:
-        self._indent.key = ""
+        level = self._indent  # more() and less() always bring this one back
+        level.key = ""
         self._readExcess()
-        indent = len(self._indent)
+        indent = len(level)
         if self._tabs < indent:
             return
         if len(self._line) > indent and self._line[indent] == 35:
             array.comment_intro = self._readComment(indent + 1)
         self._readExcess()
         while self._tabs == indent:
-            self._indent.key = len(array)
-            size = len(self._line) - indent
+            line = self._line
+            level.key = len(array)
+            size = len(line) - indent
             assert size >= 0
             value: Value | None = None
-            match 10 if size == 0 else self._line[indent]:
+            match 10 if size == 0 else line[indent]:
+                case byte if not _MARKERS[byte]:
+                    value = Text._parsed(line[indent:], -1)
+                    self._readln()
                 case 10:
-                    value = Text(b"", -1)
+                    value = Text._parsed(b"", -1)
                     self._readln()
                 case 35:
                     self._errors_add("unattached comment")
@@ -653,13 +794,13 @@ class RAM:
                     self._errors_add("key comment in list context")
                     self._readComment(indent)
                 case 60:
-                    if size != 2 or self._line[-1] != 62:
+                    if size != 2 or line[-1] != 62:
                         self._errors_add("malformed text opening")
                         self._readln()
                     else:
                         value = self._readText()
                 case 91:
-                    if size != 2 or self._line[-1] != 93:
+                    if size != 2 or line[-1] != 93:
                         self._errors_add("malformed linear array opening")
                         self._readln()
                     else:
@@ -669,7 +810,7 @@ class RAM:
                         self._readList(value)
                         self._indent = self._indent.less()
                 case 123:
-                    if size != 2 or self._line[-1] != 125:
+                    if size != 2 or line[-1] != 125:
                         self._errors_add("malformed associative array opening")
                         self._readln()
                     else:
@@ -678,9 +819,6 @@ class RAM:
                         self._indent = self._indent.more()
                         self._readDict(value)
                         self._indent = self._indent.less()
-                case _:
-                    value = Text(self._line[indent:], -1)
-                    self._readln()
             if value is not None:
                 if self._tabs == indent:
                     if len(self._line) > indent and self._line[indent] == 35:
@@ -689,9 +827,10 @@ class RAM:
             self._readExcess()
 
     def _readDict(self, array: Dict | File) -> None:
-        self._indent.key = ""
+        level = self._indent
+        level.key = ""
         self._readExcess()
-        indent = len(self._indent)
+        indent = len(level)
         if self._tabs < indent:
             return
         if len(self._line) > indent and self._line[indent] == 35:
@@ -701,7 +840,8 @@ class RAM:
         comment: Comment | None = None
         self._readExcess()
         while self._tabs == indent:
-            size = len(self._line) - indent
+            line = self._line
+            size = len(line) - indent
             assert size >= 0
             if size == 0:
                 if comment:
@@ -713,14 +853,25 @@ class RAM:
                 self._readln()
                 continue
             key: Key | None = None
-            self._indent.key = key
+            level.key = key
             value: Value | None = None
-            match self._line[indent]:
+            match line[indent]:
+                case byte if not _MARKERS[byte]:
+                    if self._assign < 0:
+                        self._errors_add("malformed `key=value` association")
+                        self._readln()
+                    else:
+                        start = self._next - len(line) - 1
+                        name = self._bytes[start + indent : start + self._assign]
+                        key = Key._parsed(name)
+                        level.key = key
+                        value = Text._parsed(line[self._assign + 1 :], -1)
+                        self._readln()
                 case 35:
                     self._errors_add("illegal position for comment")
                     self._readComment(indent + 1)
                 case 47:
-                    if size < 2 or self._line[indent + 1] != 47:
+                    if size < 2 or line[indent + 1] != 47:
                         self._errors_add("malformed key comment")
                         self._readComment(indent)
                     elif comment:
@@ -729,46 +880,40 @@ class RAM:
                     else:
                         comment = self._readComment(indent + 2)
                 case 60:
-                    if size < 2 or self._line[-1] != 62:
+                    if size < 2 or line[-1] != 62:
                         self._errors_add("malformed text opening")
                         self._readln()
                     else:
-                        key = Key(self._line[indent + 1 : -1].tobytes().decode())
-                        self._indent.key = key
+                        start = self._next - len(line) + indent
+                        key = Key._parsed(self._bytes[start : self._next - 2])
+                        level.key = key
                         value = self._readText()
                 case 91:
-                    if size < 2 or self._line[-1] != 93:
+                    if size < 2 or line[-1] != 93:
                         self._errors_add("malformed linear array opening")
                         self._readln()
                     else:
-                        key = Key(self._line[indent + 1 : -1].tobytes().decode())
-                        self._indent.key = key
+                        start = self._next - len(line) + indent
+                        key = Key._parsed(self._bytes[start : self._next - 2])
+                        level.key = key
                         self._readln()
                         value = List()
                         self._indent = self._indent.more()
                         self._readList(value)
                         self._indent = self._indent.less()
                 case 123:
-                    if size < 2 or self._line[-1] != 125:
+                    if size < 2 or line[-1] != 125:
                         self._errors_add("malformed associative array opening")
                         self._readln()
                     else:
-                        key = Key(self._line[indent + 1 : -1].tobytes().decode())
-                        self._indent.key = key
+                        start = self._next - len(line) + indent
+                        key = Key._parsed(self._bytes[start : self._next - 2])
+                        level.key = key
                         self._readln()
                         value = Dict()
                         self._indent = self._indent.more()
                         self._readDict(value)
                         self._indent = self._indent.less()
-                case _:
-                    if self._assign < 0:
-                        self._errors_add("malformed `key=value` association")
-                        self._readln()
-                    else:
-                        key = Key(self._line[indent : self._assign].tobytes().decode())
-                        self._indent.key = key
-                        value = Text(self._line[self._assign + 1 :], -1)
-                        self._readln()
             if value is None:
                 assert key is None
             else:
@@ -1,13 +1,23 @@
 from io import StringIO
 
+# every chain of Indent shares these, instead of each level holding private bytes
+_ladder = [b""]
+
+
+def _tabs(depth: int) -> bytes:
+    while len(_ladder) <= depth:
+        _ladder.append(_ladder[-1] + b"\t")
+    return _ladder[depth]
+
 
 class Indent:
-    __slots__ = ("_bytes", "_more", "_less", "key")
+    __slots__ = ("_bytes", "_newline", "_more", "_less", "key")
 
     def __init__(self, value: bytes):
         if value.count(b"\t") != len(value):
             raise AssertionError("indent must be tab chars only")
-        self._bytes = value
+        self._bytes = _tabs(len(value))
+        self._newline = b"\n" + self._bytes  # line break plus indent, one write
         self._more: Indent | None = None
         self._less: Indent | None = None
         self.key: str | int | None = None
@@ -15,7 +25,7 @@ class Indent:
     def more(self) -> "Indent":
         result = self._more
         if result is None:
-            result = self._more = Indent(self._bytes + b"\t")
+            result = self._more = Indent(_tabs(len(self._bytes) + 1))
             result._less = self
         else:
             result.key = None
@@ -44,19 +54,23 @@ class Indent:
         return f"<Indent {len(self)} @{self.path().getvalue()}>"
 
     def path(self, into: StringIO | None = None) -> StringIO:
-        if self._less is not None:
-            into = self._less.path(into)
-        elif self.key is None:
+        # walk up to the root, then write downwards: no recursion per level
+        chain = list[Indent]()
+        indent: Indent | None = self
+        while indent is not None:
+            chain.append(indent)
+            indent = indent._less
+        if chain[-1].key is None:
             # often the zeroth key is None and the File key is in 1st indent...
-            return into or StringIO()
-        elif into is None:
-            into = StringIO()
-        into.write("/")
-        match self.key:
-            case str(key):
-                into.write(key)
-            case key if key is ...:
-                into.write("~...")  # for testing purposes
-            case key:
-                into.write(str(key).replace("~", "~0").replace("/", "~1"))
+            chain.pop()
+        into = into or StringIO()
+        for indent in reversed(chain):
+            into.write("/")
+            match indent.key:
+                case str(key):
+                    into.write(key)
+                case key if key is ...:
+                    into.write("~...")  # for testing purposes
+                case key:
+                    into.write(str(key).replace("~", "~0").replace("/", "~1"))
         return into
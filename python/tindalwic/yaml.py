@@ -1,10 +1,14 @@
 from io import BytesIO
-from typing import Iterable, TypeAlias
-from . import File, Dict, List, Text, Comment, Value, Key, Encoded
+from typing import ClassVar, Iterable, Iterator, TypeAlias
+from . import File, Dict, List, Text, Comment, Value, Key, Encoded, _handler
 
 __all__ = ["YAML"]
 
 LINES: TypeAlias = Iterable[Encoded]
+CHILDREN: TypeAlias = tuple[bytes, Iterator[tuple[Key | bool, Value]]]
+
+# comment markers for each depth, shared by every YAML and built only once
+_depths = list[bytes]()
 
 
 class YAML:
@@ -20,26 +24,31 @@ class YAML:
     """
 
     def __init__(self):
-        self._stream = BytesIO()
+        self._parts = list[Encoded]()  # joined once at the end of encode
 
     def _write(self, *values: Encoded) -> None:
-        for value in values:
-            self._stream.write(value)
+        self._parts += values
 
     def encode(self, file: File) -> BytesIO:
         try:
             self._comment(b"", b"!", file.hashbang)
-            self._dict(b"", False, file)
-            return self._stream
+            indent, entries = self._dict(b"", False, file)
+            for key, value in entries:
+                self._value(indent, key, value)
+            return BytesIO(b"".join(self._parts))
         finally:
-            self._stream = BytesIO()
+            self._parts.clear()
 
     def _utf8(self, indent: bytes, prefix: bytes, utf8: LINES) -> None:
+        head = indent + prefix
         for line in utf8:
-            self._write(indent, prefix, line, b"\n")
+            self._parts += (head, line, b"\n")
 
     def _comment_depth(self, indent: bytes) -> bytes:
-        return b"#%d" % len(indent)
+        depth = len(indent)
+        while len(_depths) <= depth:
+            _depths.append(b"#%d" % len(_depths))
+        return _depths[depth]
 
     def _comment_lines(self, marked: bytes, prefix: bytes, utf8: LINES) -> None:
         self._utf8(marked, prefix, utf8)
@@ -50,16 +59,29 @@ class YAML:
             self._comment_lines(marked, prefix, comment.lines())
 
     def _value(self, indent: bytes, key: Key | bool, value: Value) -> None:
-        match value:
-            case Text():
-                self._text(indent, key, value)
-            case List():
-                self._list(indent, key, value)
-            case Dict():
-                self._dict(indent, key, value)
-            case _:
+        # iterative: open arrays wait on a stack rather than in python frames
+        stack = list[tuple[bytes, List | Dict, bytes, Iterator]]()
+        while True:
+            write = _handler(self._write_value, value)
+            if write is None:
                 raise ValueError(f"unexpected type: {type(value)}")
-        self._comment(indent, b"a:", value.comment_after)
+            children = getattr(self, write)(indent, key, value)
+            if children is None:
+                if value.comment_after is not None:  # checked here, saves a call
+                    self._comment(indent, b"a:", value.comment_after)
+            else:
+                stack.append((indent, value, *children))
+            while stack:
+                outer, array, indent, items = stack[-1]
+                entry = next(items, None)
+                if entry is not None:
+                    key, value = entry
+                    break
+                stack.pop()
+                if array.comment_after is not None:
+                    self._comment(outer, b"a:", array.comment_after)
+            else:
+                return
 
     def _text(self, indent: bytes, key: Key | bool, text: Text) -> None:
         value = list(text.lines())
@@ -74,45 +96,61 @@ class YAML:
             self._key(indent, key, b"|2+")
             self._utf8(indent, b"  ", value[:-1])
 
-    def _list(self, indent: bytes, key: Key | bool, items: List) -> None:
+    # the array writers return the indentation and (key, value) pairs of their items
+
+    def _list(self, indent: bytes, key: Key | bool, items: List) -> CHILDREN:
         if not items:
             self._key(indent, key, b"[]#")  # comment is to help ruamel.yaml
-        else:
-            assert key is not False
-            self._key(indent, key, b"")
-            indent = indent + b" "
-            self._comment(indent, b"i:", items.comment_intro)
-            for value in items:
-                self._value(indent, True, value)
-
-    def _dict(self, indent: bytes, key: Key | bool, entries: Dict | File) -> None:
+            return indent, iter(())
+        assert key is not False
+        self._key(indent, key, b"")
+        indent = indent + b" "
+        self._comment(indent, b"i:", items.comment_intro)
+        return indent, ((True, value) for value in items)
+
+    def _dict(self, indent: bytes, key: Key | bool, entries: Dict | File) -> CHILDREN:
         if not entries:
             self._key(indent, key, b"{}#")  # comment is to help ruamel.yaml
-        else:
-            if key is not False:
-                self._key(indent, key, b"")
-                indent = indent + b" "
-            self._comment(indent, b"i:", entries.comment_intro)
-            for key, value in entries.items():
-                if key.blank_line_before:
-                    self._comment_lines(self._comment_depth(indent), b"b", (b"",))
+            return indent, iter(())
+        if key is not False:
+            self._key(indent, key, b"")
+            indent = indent + b" "
+        self._comment(indent, b"i:", entries.comment_intro)
+        return indent, self._entries(indent, entries)
+
+    def _entries(
+        self, indent: bytes, entries: Dict | File
+    ) -> Iterator[tuple[Key, Value]]:
+        for key, value in entries.items():
+            if key.blank_line_before:
+                self._comment_lines(self._comment_depth(indent), b"b", (b"",))
+            if key.comment_before is not None:
                 self._comment(indent, b"k:", key.comment_before)
-                self._value(indent, key, value)
+            yield key, value
+
+    # names, not functions, so that subclass overrides are called
+    _write_value: ClassVar[dict[type, str]] = {
+        Text: "_text",
+        List: "_list",
+        Dict: "_dict",
+    }
 
     def _key(self, indent: bytes, key: Key | bool, end: bytes) -> None:
-        self._write(indent)
+        # each case emits the whole line in one _write, the common Key() case first
         match key:
-            case False:
-                self._write(end)
-            case True:
-                self._write(b"-")
-                if end:
-                    self._write(b" ", end)
             case Key():
+                # not str.translate: multi-character replacements take its slow path
                 safe = key.replace("\\", r"\\").replace('"', r"\"").replace("\t", r"\t")
-                self._write(b'"', safe.encode(), b'":')
                 if end:
-                    self._write(b" ", end)
+                    self._write(indent, b'"', safe.encode(), b'": ', end, b"\n")
+                else:
+                    self._write(indent, b'"', safe.encode(), b'":\n')
+            case True:
+                if end:
+                    self._write(indent, b"- ", end, b"\n")
+                else:
+                    self._write(indent, b"-\n")
+            case False:
+                self._write(indent, end, b"\n")
             case _:
                 raise ValueError(f"unexpected type: {type(key)}")
-        self._write(b"\n")
@@ -51,11 +51,10 @@ class StealComments(YAML):
         self.comments = list[str]()
 
     def _comment_lines(self, marked: bytes, prefix: bytes, utf8: LINES) -> None:
-        for line in utf8:
-            if isinstance(line, memoryview):
-                line = line.tobytes()
-            self.comments.append(f"{marked.decode()}{prefix.decode()}{line.decode()}")
-            super()._utf8(marked, prefix, (line,))
+        lines = list(utf8)
+        before = (marked + prefix).decode()
+        self.comments.extend(before + bytes(line).decode() for line in lines)
+        super()._utf8(marked, prefix, lines)
 
 
 class TimedTindalwic:
@@ -67,21 +66,26 @@ class TimedTindalwic:
         self.memory = RAM()
         self.pstats = pstats
         self.profile = Profile(builtins=False) if pstats else None
+        # each operation runs inside the profiler or its own timer, chosen once here
+        self._python = self.profile or self.python_timer
+        self._file = self.profile or self.file_timer
+        self._encode = self.profile or self.encode_timer
+        self._decode = self.profile or self.decode_timer
 
     def python(self, file: File) -> dict:
-        with self.profile if self.profile else self.python_timer:
+        with self._python:
             return self.memory.python(file)
 
     def file(self, mapping: Mapping) -> File:
-        with self.profile if self.profile else self.file_timer:
+        with self._file:
             return self.memory.file(mapping)
 
     def encode(self, file: File, into: BytesIO | None = None) -> BytesIO:
-        with self.profile if self.profile else self.encode_timer:
+        with self._encode:
             return self.memory.encode(file)
 
     def decode(self, buffer: Encoded) -> File:
-        with self.profile if self.profile else self.decode_timer:
+        with self._decode:
             return self.memory.decode(buffer)
 
     def timers(self) -> None:
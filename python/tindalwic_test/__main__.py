@@ -78,6 +78,10 @@ widest_option = Option(
     help="limit the breadth of generated random data structure",
     min=0,
 )
+ruamel_option = Option(
+    "--ruamel/--no-ruamel",
+    help="include the ruamel.yaml conversions (always skipped with `pstats`)",
+)
 failures_option = Option(
     help="write failure details to this directory",
     exists=True,
@@ -91,13 +95,15 @@ failures_option = Option(
 
     Without the `pstats` option broad timing information is gathered and the ruamel.yaml
     conversions are included. The `pstats` option switches to detailed cProfile stats,
-    focused only on the Tindalwic library (ruamel.yaml conversions are skipped).""",
+    focused only on the Tindalwic library (ruamel.yaml conversions are skipped). The
+    `--no-ruamel` option skips them too, keeping the timing of the Tindalwic library.""",
 )
 def main(
     pstats: Annotated[Path | None, profile_option] = None,
     loops: Annotated[int, loops_option] = 250,
     deepest: Annotated[int, deepest_option] = 6,
     widest: Annotated[int, widest_option] = 8,
+    ruamel_yaml: Annotated[bool, ruamel_option] = True,
     failures: Annotated[Path | None, failures_option] = None,
 ):
     if pstats and pstats.exists():
@@ -109,11 +115,12 @@ def main(
     if loops:
         random = Random(deepest=deepest, widest=widest, empties=False)
         memory = TimedTindalwic(pstats)
-        ruamel = None if pstats else TimedRuamel(memory)
+        ruamel = TimedRuamel(memory) if ruamel_yaml and not pstats else None
         empties = 0
+        generated = [random.file() for _ in range(loops)]  # not part of the timings
 
-        for loop in track(range(loops)):
-            original = memory.separated(random.file())
+        for file in track(generated, update_period=0.5):
+            original = memory.separated(file)
 
             modified_file = memory.file(original.python)
 
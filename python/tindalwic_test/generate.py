@@ -1,9 +1,26 @@
-from random import randrange, choice, choices
+from functools import cache
+from random import random, getrandbits, randbytes
+from typing import TypeVar
 from tindalwic import Comment, Text, List, Dict, Value, File, Key
 from tindalwic.pointer import Indent
 
-bools = (False, True)
-ascii = b"\t" + bytes(it for it in range(32, 127))
+D = TypeVar("D", Dict, File)
+ascii = b"\t" + bytes(range(32, 127))
+
+
+@cache
+def _translation(alphabet: bytes) -> tuple[bytes, bytes]:
+    # uniform: random bytes past the last whole copy of the alphabet are deleted
+    usable = 256 // len(alphabet) * len(alphabet)
+    return (alphabet * (256 // len(alphabet) + 1))[:256], bytes(range(usable, 256))
+
+
+def _random_bytes(alphabet: bytes, length: int) -> bytes:
+    table, excess = _translation(alphabet)
+    result = randbytes(length).translate(table, excess)
+    while len(result) < length:
+        result += randbytes(length - len(result)).translate(table, excess)
+    return result
 
 
 class Random:
@@ -20,8 +37,10 @@ class Random:
 
     def _comment(self, kind: str, indent: Indent) -> Comment:
         result = [f"{self.indent.path().getvalue()} {kind}".encode()]
-        for loop in range(randrange(3)):
-            result.append(bytes(choices(self.comment, k=randrange(80))))
+        result += [
+            _random_bytes(self.comment, int(random() * 80))
+            for loop in range(int(random() * 3))
+        ]
         if len(result) == 1:
             return Comment(result[0], -1)
         else:
@@ -29,9 +48,10 @@ class Random:
             return Comment(sep.join(result), len(indent))
 
     def _text(self) -> Text:
-        text = list[bytes]()
-        for loop in range(randrange(3)):
-            text.append(bytes(choices(self.text, k=randrange(80))))
+        text = [
+            _random_bytes(self.text, int(random() * 80))
+            for loop in range(int(random() * 3))
+        ]
         match len(text):
             case 0:
                 return Text()
@@ -43,47 +63,50 @@ class Random:
 
     def _list(self, array: List) -> List:
         depth = len(self.indent)
-        if depth < randrange(self.deepest):
-            self.indent = self.indent.more()
-            for key in range(randrange(self.widest)):
-                self.indent.key = key
-                array.append(self._value(depth))
-            self.indent = self.indent.less()
+        if depth < int(random() * self.deepest):
+            indent = self.indent = self.indent.more()
+            append = array.append
+            for key in range(int(random() * self.widest)):
+                indent.key = key
+                append(self._value(depth))
+            self.indent = indent.less()
         if not array and not self.empties:
             array.append(self._text())
-        if choice(bools):
+        flags = getrandbits(2)  # one draw, a bit for each optional comment
+        if flags & 1:
             array.comment_after = self._comment("after", self.indent)
-        if choice(bools):
+        if flags & 2:
             array.comment_intro = self._comment("intro", self.indent.more())
         return array
 
-    def _dict_entries(self, array: Dict | File) -> None:
+    def _dict(self, array: D) -> D:
         depth = len(self.indent)
-        if depth < randrange(self.deepest):
-            self.indent = self.indent.more()
-            for loop in range(randrange(self.widest)):
-                key = Key(bytes(choices(self.key, k=randrange(20))).decode())
-                self.indent.key = key
-                if choice(bools):
+        if depth < int(random() * self.deepest):
+            # locals: the loop body runs once per entry
+            indent = self.indent = self.indent.more()
+            alphabet = self.key
+            for loop in range(int(random() * self.widest)):
+                key = Key(_random_bytes(alphabet, int(random() * 20)).decode())
+                indent.key = key
+                flags = getrandbits(2)
+                if flags & 1:
                     key.blank_line_before = True
-                if choice(bools):
-                    key.comment_before = self._comment("before", self.indent)
+                if flags & 2:
+                    key.comment_before = self._comment("before", indent)
                 array[key] = self._value(depth)
-            self.indent = self.indent.less()
+            self.indent = indent.less()
         if not array and not self.empties:
-            key = Key(bytes(choices(self.key, k=randrange(20))).decode())
+            key = Key(_random_bytes(self.key, int(random() * 20)).decode())
             array[key] = self._text()
-        if choice(bools):
+        flags = getrandbits(2)
+        if flags & 1:
             array.comment_intro = self._comment("intro", self.indent.more())
-
-    def _dict(self, array: Dict) -> Dict:
-        self._dict_entries(array)
-        if choice(bools):
+        if flags & 2 and isinstance(array, Dict):  # a File has no comment_after
             array.comment_after = self._comment("after", self.indent)
         return array
 
     def _value(self, depth: int) -> Value:
-        match randrange(3):
+        match int(random() * 3):
             case 0:
                 return self._dict(Dict())
             case 1:
@@ -94,7 +117,6 @@ class Random:
     def file(self) -> File:
         self.indent = self.indent.zero()
         file = File()
-        if choice(bools):
+        if getrandbits(1):
             file.hashbang = self._comment("hashbang", self.indent)
-        self._dict_entries(file)
-        return file
+        return self._dict(file)
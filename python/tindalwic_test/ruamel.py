@@ -147,16 +147,12 @@ class TimedRuamel:
             # ruamel drops comments that follow empty seq/map
             # https://sourceforge.net/p/ruamel-yaml/tickets/search/?q=empty
             return None
-        steal.comments.sort(key=lambda it: it.start_mark.line)
-        index = len(steal.comments) - 1
-        while index > 0:
-            if steal.comments[index] is steal.comments[index - 1]:
-                # not sure why duplicates are stored, but it seems to be intentional.
-                # detecting and correcting the situation is super easy and 100% safe...
-                del steal.comments[index]
-            index -= 1
+        # not sure why duplicates are stored, but it seems to be intentional.
+        # dropping repeats of the same token object is super easy and 100% safe...
+        unique = {id(it): it for it in steal.comments}
+        comments = sorted(unique.values(), key=lambda it: it.start_mark.line)
         lines = list[str]()
-        for comment in steal.comments:
+        for comment in comments:
             for line in comment.value.splitlines():
                 line = line.lstrip()
                 if line and line != "#":
@@ -1,24 +1,49 @@
 import re
+import sys
+import threading
 from collections import UserString
-from typing import Any, TypeAlias, ClassVar, ContextManager
+from functools import cache
+from types import MappingProxyType
+from typing import Any, ClassVar, ContextManager
 import unittest
 import tindalwic_test
 from tindalwic import RAM, UTF8, Comment, Text, Key, File, List, Dict
 from tindalwic.pointer import Indent
 from tindalwic.yaml import YAML
 
-ExType: TypeAlias = type[BaseException]
-
 # focus is on filling in gaps left  by the timing script in tindalwic_test.__main__
 # goal is to test all error branches to get 100% coverage of tindalwic.__init__
 
 
+@cache
+def _anchored(literal: str) -> re.Pattern:
+    """the whole message must match, tests repeat messages so compile each once."""
+    return re.compile(f"\\A{re.escape(literal)}\\Z")
+
+
 class BadFile(File):
     def __init__(self, message: str):
         super().__init__()
         self.message = message
 
 
+class Upper(RAM):
+    """a subclass overriding handlers that are found through the type tables."""
+
+    def _writeText(self, key: Key | None, text: Text) -> None:
+        super()._writeText(key, Text(bytes(text).upper(), text.dedent))
+
+    def _pythonText(self, text: Text) -> tuple[str, None]:
+        return str(text).upper(), None
+
+
+class Null(YAML):
+    """a subclass overriding a writer found through the type table."""
+
+    def _text(self, indent: bytes, key: Key | bool, text: Text) -> None:
+        self._key(indent, key, b"~")
+
+
 class Impossible(RAM):
     """a broken subclass that returns an impossible result from select methods."""
 
@@ -40,17 +65,11 @@ class Impossible(RAM):
 
 
 class TestCase(unittest.TestCase):
-    def assertRaisesExactly(self, ex: ExType, literal: str) -> ContextManager:
-        pattern = re.compile(f"\\A{re.escape(literal)}\\Z")
-        manager = self.assertRaisesRegex(ex, pattern)
-        assert isinstance(manager, ContextManager)
-        return manager
-
     def assertValueError(self, literal: str) -> ContextManager:
-        return self.assertRaisesExactly(ValueError, literal)
+        return self.assertRaisesRegex(ValueError, _anchored(literal))
 
     def assertAssertionError(self, literal: str) -> ContextManager:
-        return self.assertRaisesExactly(AssertionError, literal)
+        return self.assertRaisesRegex(AssertionError, _anchored(literal))
 
     def illegalEllipsisKey(self, message: str, include_line=False) -> BadFile:
         line = "#1: " if include_line else ""
@@ -64,6 +83,17 @@ class TestCase(unittest.TestCase):
         result[Key("k")] = ...  # type: ignore
         return result
 
+    def deepFile(self) -> tuple[File, int]:
+        """a chain of Dicts nested past the recursion limit, and how deep it is."""
+        depth = sys.getrecursionlimit() + 100
+        file = File()
+        inner: File | Dict = file
+        for loop in range(depth):
+            child = Dict()
+            inner[Key("k")] = child
+            inner = child
+        return file, depth
+
     def illegalEllipsisItem(self, message: str, include_line=False) -> BadFile:
         line = "#2: " if include_line else ""
         result = BadFile(f"{message}:\n\t{line}value is <class 'ellipsis'> @/k/0")
@@ -98,6 +128,12 @@ class TestKey(TestCase):
         with self.assertValueError("newline in key"):
             Key("_\n_")
 
+    def test_unencodable(self):
+        file = File(**{"\ud800": Text()})  # a lone surrogate is a legal str
+        self.assertEqual(RAM().file({"\ud800": None}), file)
+        with self.assertRaises(UnicodeEncodeError):
+            RAM().encode(file)
+
 
 class TestIndent(TestCase):
     def test_illegal(self):
@@ -143,6 +179,16 @@ class TestYAML(TestCase):
     def test_text_tricky(self):
         self.assertEncoded(File(t=Text("\no\nt\n")), b'"t": |2+\n  \n  o\n  t')
 
+    def test_deep(self):
+        file, depth = self.deepFile()
+        yaml = YAML().encode(file).getvalue()
+        self.assertEqual(yaml.count(b"\n"), depth)
+        self.assertTrue(yaml.endswith(b" " * (depth - 1) + b'"k": {}#\n'))
+
+    def test_override(self):
+        yaml = Null().encode(File(t=Text("v"), l=List(Text("w")))).getvalue()
+        self.assertEqual(yaml, b'"t": ~\n"l":\n - ~\n')
+
     def test_bad_value(self):
         with self.assertValueError("unexpected type: <class 'ellipsis'>"):
             YAML()._value(b"", False, ...)  # type: ignore
@@ -208,6 +254,19 @@ class TestMiscAndErrors(TestCase):
         message = "one two five"
         self.assertIs(RAM()._error(message), message)
 
+    def test_local(self):
+        ram = RAM.local()
+        self.assertIs(RAM.local(), ram)
+        other = list[RAM]()
+        thread = threading.Thread(target=lambda: other.append(RAM.local()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], ram)
+        upper = Upper.local()
+        self.assertIs(type(upper), Upper)
+        self.assertIs(Upper.local(), upper)
+        self.assertIs(RAM.local(), ram)
+
     def test_eq_ignores_comments(self):
         one = File(k=Text("t", after=Comment("one")))
         two = File(k=Text("t", after=Comment("two")))
@@ -232,6 +291,17 @@ class TestPython(TestCase):
         with self.assertAssertionError("impossible: got <class 'ellipsis'>"):
             Impossible(...).python(File())
 
+    def test_override(self):
+        file = File(k=Text("v"), l=List(Text("w")))
+        self.assertEqual(Upper().python(file), {"k": "V", "l": ["W"]})
+
+    def test_deep(self):
+        file, depth = self.deepFile()
+        result = RAM().python(file)
+        for loop in range(depth):
+            result = result["k"]  # a walk: == on the whole chain would recurse
+        self.assertEqual(result, {})
+
     illegal: ClassVar[str] = "illegal non-`Value` data"
 
     def test_illegal_key(self):
@@ -257,6 +327,25 @@ class TestFile(TestCase):
     def test_none_is_empty_text(self):
         self.assertEqual(File(k=Text()), RAM().file({"k": None}))
 
+    def test_deep(self):
+        depth = sys.getrecursionlimit() + 100
+        mapping: dict = {}
+        inner = mapping
+        for loop in range(depth):
+            child: dict = {}
+            inner["k"] = child
+            inner = child
+        result: File | Dict = RAM().file(mapping)
+        for loop in range(depth):
+            result = result["k"]
+        self.assertEqual(result, Dict())
+
+    def test_subclasses(self):
+        # UserString is found in the MRO, range and mappingproxy are only virtual
+        mapping = {"s": UserString("v"), "l": range(0), "d": MappingProxyType({})}
+        expect = File(s=Text("v"), l=List(), d=Dict())
+        self.assertEqual(RAM().file(mapping), expect)
+
     illegal: ClassVar[str] = "can't be converted to `Value`"
 
     def test_illegal_key(self):
@@ -293,6 +382,10 @@ class TestEncode(TestCase):
         with self.assertValueError(bad_file.message):
             RAM().encode(bad_file)
 
+    def test_override(self):
+        file = File(k=Text("v"), l=List(Text("w")))
+        self.assertEqual(Upper().encode(file).getvalue(), b"k=V\n[l]\n\tW")
+
 
 class TestDecode(TestCase):
     def test_readln(self):
@@ -304,6 +397,22 @@ class TestDecode(TestCase):
     def test_lenient_text(self):
         self.assertEqual(RAM().decode(b"<k>\n\t"), File(k=Text()))
 
+    def test_final_newline_text(self):
+        ram = RAM()
+        self.assertEqual(repr(ram.decode(b"<k>\n\tv\n")), "File(k=Text(b'v'))")
+        self.assertEqual(repr(ram.decode(b"<k>\n\tv\n\tw\n")), "File(k=Text(b'v\\nw'))")
+        self.assertEqual(ram.python(ram.decode(b"<k>\n\tv\n")), {"k": "v"})
+        self.assertEqual(ram.encode(ram.decode(b"<k>\n\tv\n")).getvalue(), b"k=v")
+
+    def test_final_newline_comment(self):
+        ram = RAM()
+        self.assertEqual(repr(ram.decode(b"#c\n")), "File(None,Comment(b'c'))")
+        self.assertEqual(
+            repr(ram.decode(b"k=v\n#a\n\tb\n")),
+            "File(k=Text(b'v',after=Comment(b'a\\nb')))",
+        )
+        self.assertEqual(ram.encode(ram.decode(b"k=v\n#a\n")).getvalue(), b"k=v\n#a")
+
     def assertParseError(self, literal: str) -> ContextManager:
         return self.assertValueError(f"parse errors:\n\t{literal}")
 